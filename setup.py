@@ -30,6 +30,7 @@ setup(
     version=VERSION,
     packages=find_packages(),
     install_requires=read_requirements(),
+    extras_require={"orjson": ["orjson"]},
     entry_points={
         "console_scripts": [
             "wslshot = wslshot.cli:wslshot",
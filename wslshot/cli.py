@@ -17,16 +17,89 @@ For detailed usage instructions, use 'wslshot --help' or 'wslshot [command] --he
 """
 
 import datetime
+import errno
+import functools
 import json
-import shutil
-import subprocess
+import os
+import stat
 import sys
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import click
 from click_default_group import DefaultGroup
 
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:  # orjson is an optional, faster JSON library.
+    json_loads = json.loads
+
+    def json_dumps(data: Any) -> bytes:
+        # Same output as orjson.OPT_INDENT_2.
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+# fdatasync flushes the data and the size needed to read it back, but not the timestamps.
+# Directories are still flushed with os.fsync.
+fdatasync = getattr(os, "fdatasync", os.fsync)
+
+SCREENSHOT_FILE_MODE = 0o644
+COPY_BUFFER_SIZE = 1024 * 1024
+COPY_FILE_RANGE_UNSUPPORTED_ERRNOS = frozenset(
+    (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM)
+)
+
+# Lowercase, dot included, for str.endswith().
+SUPPORTED_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif")
+# Filesystems on which each stat is a round trip to a file server, worth overlapping in threads.
+# On local filesystems, a thread pool only slows the stats down.
+HIGH_LATENCY_FILESYSTEMS = frozenset(
+    ("9p", "drvfs", "nfs", "nfs4", "cifs", "smb3", "smbfs", "fuse.sshfs")
+)
+PARALLEL_STAT_WORKERS = 8
+# Characters octal-escaped by the kernel in the mount points of /proc/self/mounts.
+MOUNT_POINT_ESCAPES = ((b"\\040", b" "), (b"\\011", b"\t"), (b"\\012", b"\n"), (b"\\134", b"\\"))
+MAX_CONFIG_FILE_SIZE = 1024 * 1024
+
+# Styled once, rather than on every error.
+FETCH_ERROR_HEADER = click.style("An error occurred while fetching the screenshot(s).", fg="red")
+CONFIG_UPDATING_HEADER = click.style("Updating the configuration file...", fg="yellow")
+CONFIG_CREATING_HEADER = click.style("Creating the configuration file...", fg="yellow")
+CONFIG_UPDATED_TRAILER = click.style("Configuration file updated", fg="green")
+CONFIG_CREATED_TRAILER = click.style("Configuration file created", fg="green")
+
+# Parsed configuration files, keyed by path, along with their mtime and size.
+_CONFIG_CACHE: Dict[Path, Tuple[int, int, Dict[str, Any]]] = {}
+
+# Image directories looked up in a Git repository, by order of preference.
+# The last one is created if none of them exists.
+GIT_IMAGE_DIRECTORY_PRIORITY = (
+    ("img",),
+    ("images",),
+    ("assets", "img"),
+    ("assets", "images"),
+)
+# The top-level directory and the joined relative path of each candidate, computed once.
+GIT_IMAGE_DIRECTORY_CANDIDATES = tuple(
+    (relative_parts[0], os.path.join(*relative_parts))
+    for relative_parts in GIT_IMAGE_DIRECTORY_PRIORITY
+)
+
+OUTPUT_FORMAT_TEMPLATES = {
+    "markdown": "![{name}]({path})",
+    "html": '<img src="{path}" alt="{name}">',
+    "plain_text": "{path}",
+}
+# Ordered for display; the frozenset serves membership tests.
+VALID_OUTPUT_FORMATS = tuple(OUTPUT_FORMAT_TEMPLATES)
+VALID_OUTPUT_FORMAT_SET = frozenset(VALID_OUTPUT_FORMATS)
+
 
 @click.group(cls=DefaultGroup, default="fetch", default_if_no_args=True)
 @click.version_option(package_name="wslshot")
@@ -58,9 +131,8 @@ def wslshot():
 @click.option(
     "--output-format",
     "-f",
-    help=(
-        "Specify the output format (markdown, HTML, path). Overrides the default set in" " config."
-    ),
+    type=click.Choice(VALID_OUTPUT_FORMATS, case_sensitive=False),
+    help="Specify the output format. Overrides the default set in config.",
 )
 @click.argument("image_path", type=click.Path(exists=True), required=False)
 def fetch(source, destination, count, output_format, image_path):
@@ -103,24 +175,18 @@ def fetch(source, destination, count, output_format, image_path):
         sys.exit(1)
 
     # Output format
+    # The option is validated and lowercased by click. The configured default is checked here,
+    # before anything is copied or staged, and may hold a mixed-case value (e.g., "Markdown").
     if output_format is None:
-        output_format = config["default_output_format"]
-
-    if output_format.casefold() not in ("markdown", "html", "plain_text"):
-        click.echo(f"Invalid output format: {output_format}")
-        click.echo("Valid options are: markdown, html, plain_text")
-        sys.exit(1)
+        output_format = normalize_output_format(config["default_output_format"])
 
     # If the user specified an image path, copy it to the destination directory.
     if image_path:
         try:
-            if not image_path.lower().endswith((".png", ".jpg", ".jpeg", ".gif")):
+            if not image_path.lower().endswith(SUPPORTED_EXTENSIONS):
                 raise ValueError("Invalid image format (supported formats: png, jpg, jpeg, gif).")
         except ValueError as error:
-            click.echo(
-                f"{click.style('An error occurred while fetching the screenshot(s).',fg='red')}",
-                err=True,
-            )
+            click.echo(FETCH_ERROR_HEADER, err=True)
             click.echo(f"{error}", err=True)
             click.echo(f"Source file: {image_path}", err=True)
             sys.exit(1)
@@ -129,8 +195,8 @@ def fetch(source, destination, count, output_format, image_path):
         copied_screenshots = copy_screenshots(image_path, destination)
     else:
         # Copy the screenshot(s) to the destination directory.
-        source_screenshots = get_screenshots(source, count)
-        copied_screenshots = copy_screenshots(source_screenshots, destination)
+        source_screenshots, source_stats = zip(*get_screenshots(source, count))
+        copied_screenshots = copy_screenshots(source_screenshots, destination, source_stats)
 
     # Automatically stage the screenshot(s) if the destination is a Git repo.
     # But only if auto_stage is enabled in the config.
@@ -143,7 +209,7 @@ def fetch(source, destination, count, output_format, image_path):
     print_formatted_path(output_format, copied_screenshots)
 
 
-def get_screenshots(source: str, count: int) -> Tuple[Path, ...]:
+def get_screenshots(source: str, count: int) -> Tuple[Tuple[Path, os.stat_result], ...]:
     """
     Get the most recent screenshot(s) from the source directory.
 
@@ -152,19 +218,36 @@ def get_screenshots(source: str, count: int) -> Tuple[Path, ...]:
     - count: The number of screenshots to fetch.
 
     Returns:
-    - The screenshot(s)'s path.
+    - The screenshot(s)'s path, along with the stat result taken while scanning the directory.
     """
+    import heapq
+
     # Get the most recent screenshot(s) from the source directory.
     try:
-        # Collect files with different extensions
-        extensions = ("png", "jpg", "jpeg", "gif")
-        screenshots = [file for ext in extensions for file in Path(source).glob(f"*.{ext}")]
-
-        # Sort by modification time
-        screenshots.sort(key=lambda file: file.stat().st_mtime, reverse=True)
+        # Collect the images in a single pass over the directory.
+        with os.scandir(source) as entries:
+            candidates = [
+                entry
+                for entry in entries
+                if entry.name.lower().endswith(SUPPORTED_EXTENSIONS)
+                # Uses the file type reported by the directory listing, without a stat.
+                and entry.is_file(follow_symlinks=False)
+            ]
+
+        # Modification time first, so the tuples order without a key function.
+        file_stats = [
+            (stat_result.st_mtime, Path(entry.path), stat_result)
+            for entry, stat_result in zip(
+                candidates, stat_entries(candidates, is_high_latency_filesystem(source))
+            )
+            if stat_result is not None
+        ]
 
         # Take the `count` most recent files
-        screenshots = screenshots[:count]
+        screenshots = [
+            (file_path, stat_result)
+            for _, file_path, stat_result in heapq.nlargest(count, file_stats)
+        ]
 
         if len(screenshots) == 0:
             raise ValueError("No screenshot found.")
@@ -173,11 +256,8 @@ def get_screenshots(source: str, count: int) -> Tuple[Path, ...]:
             raise ValueError(
                 f"You requested {count} screenshot(s), but only {len(screenshots)} were found."
             )
-    except ValueError as error:
-        click.echo(
-            f"{click.style('An error occurred while fetching the screenshot(s).',fg='red')}",
-            err=True,
-        )
+    except (OSError, ValueError) as error:
+        click.echo(FETCH_ERROR_HEADER, err=True)
         click.echo(f"{error}", err=True)
         click.echo(f"Source directory: {source}\n", err=True)
         sys.exit(1)
@@ -185,7 +265,94 @@ def get_screenshots(source: str, count: int) -> Tuple[Path, ...]:
     return tuple(screenshots)
 
 
-def copy_screenshots(screenshots: Tuple[Path, ...], destination: str) -> Tuple[Path, ...]:
+def stat_entries(
+    entries: List[os.DirEntry], parallel: bool = False
+) -> List[Optional[os.stat_result]]:
+    """
+    Stat directory entries, without following symlinks.
+
+    Args:
+        entries: The directory entries to stat.
+        parallel: Whether to stat from a thread pool, to overlap the latency of each stat on
+            high-latency filesystems.
+
+    Returns:
+        The stat result of each entry, or None if it could not be stat'ed.
+    """
+    if not parallel or len(entries) < 2:
+        return [stat_entry(entry) for entry in entries]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=PARALLEL_STAT_WORKERS) as executor:
+        return list(executor.map(stat_entry, entries))
+
+
+def is_high_latency_filesystem(path: Path) -> bool:
+    """
+    Check whether a path is on a high-latency filesystem, such as DrvFs (`/mnt/c`) or a network
+    share.
+
+    The filesystem type is read from the longest matching mount point in `/proc/self/mounts`.
+
+    Args:
+        path: The resolved path to check.
+
+    Returns:
+        True if the path is on one of `HIGH_LATENCY_FILESYSTEMS`, False otherwise or if the
+        mount table can't be read.
+    """
+    encoded_path = os.fsencode(path)
+    mount_point_length = -1
+    filesystem_type = b""
+
+    try:
+        with open("/proc/self/mounts", "rb") as mounts:
+            for line in mounts:
+                fields = line.split()
+                if len(fields) < 3:
+                    continue
+
+                mount_point = fields[1]
+                for escaped, character in MOUNT_POINT_ESCAPES:
+                    mount_point = mount_point.replace(escaped, character)
+
+                if mount_point == b"/" or encoded_path == mount_point:
+                    matches = True
+                else:
+                    matches = encoded_path.startswith(mount_point.rstrip(b"/") + b"/")
+
+                # Later mounts on the same point shadow earlier ones.
+                if matches and len(mount_point) >= mount_point_length:
+                    mount_point_length = len(mount_point)
+                    filesystem_type = fields[2]
+    except OSError:
+        return False
+
+    return filesystem_type.decode("ascii", "replace") in HIGH_LATENCY_FILESYSTEMS
+
+
+def stat_entry(entry: os.DirEntry) -> Optional[os.stat_result]:
+    """
+    Stat a directory entry without following symlinks.
+
+    Args:
+        entry: The directory entry to stat.
+
+    Returns:
+        The stat result, or None if the entry vanished or could not be stat'ed.
+    """
+    try:
+        return entry.stat(follow_symlinks=False)
+    except OSError:
+        return None
+
+
+def copy_screenshots(
+    screenshots: Tuple[Path, ...],
+    destination: str,
+    screenshot_stats: Optional[Tuple[os.stat_result, ...]] = None,
+) -> Tuple[Path, ...]:
     """
     Copy the screenshot(s) to the destination directory,
     and rename the screenshot(s) to the current date and time.
@@ -193,25 +360,120 @@ def copy_screenshots(screenshots: Tuple[Path, ...], destination: str) -> Tuple[P
     Args:
     - screenshots: A tuple of Path objects representing the screenshot(s) to copy.
     - destination: The path to the destination directory.
+    - screenshot_stats: The stat results of the screenshot(s), if already known
+      (e.g., from `get_screenshots`). Saves a stat per file.
 
     Returns:
     - A tuple of Path objects representing the new locations of the copied screenshot(s).
     """
-    copied_screenshots: Tuple[Path, ...] = ()
+    copied_screenshots: List[Path] = []
+
+    destination_dir = Path(destination)
+    # One timestamp for the whole batch: the index keeps the names unique.
+    timestamp = datetime.datetime.now().isoformat(timespec="seconds")
 
     for idx, screenshot in enumerate(screenshots):
-        new_screenshot_name = rename_screenshot(idx, screenshot)
-        new_screenshot_path = Path(destination) / new_screenshot_name
-        shutil.copy(screenshot, new_screenshot_path)
-        copied_screenshots += (Path(destination) / new_screenshot_name,)
+        new_screenshot_name = rename_screenshot(idx, screenshot, timestamp)
+        new_screenshot_path = destination_dir / new_screenshot_name
+        source_stat = screenshot_stats[idx] if screenshot_stats else None
+        copy_file(screenshot, new_screenshot_path, source_stat)
+        copied_screenshots.append(new_screenshot_path)
+
+    return tuple(copied_screenshots)
+
+
+def copy_file(
+    source: Path, destination: Path, source_stat: Optional[os.stat_result] = None
+) -> None:
+    """
+    Copy the content of a file.
+
+    The source is opened once, and stat'ed only if its stat result is not provided. Its content
+    is copied in the kernel with `os.copy_file_range` when possible, or streamed in 1 MiB
+    chunks otherwise.
+
+    The copy is created with `SCREENSHOT_FILE_MODE` (minus the umask) instead of the source's
+    permission bits: files on DrvFs typically show up as 0o777, and copying those would only
+    cost a chmod to make screenshots executable.
+
+    Args:
+        source: The file to copy.
+        destination: The path of the copy.
+        source_stat: The stat result of the source, if already known.
+    """
+    import shutil
+
+    with open(source, "rb") as source_file:
+        if source_stat is None:
+            source_stat = os.fstat(source_file.fileno())
+        with open(destination, "wb", opener=open_screenshot_file) as destination_file:
+            if not copy_file_range(source_file.fileno(), destination_file.fileno(), source_stat):
+                shutil.copyfileobj(source_file, destination_file, COPY_BUFFER_SIZE)
+
+
+def open_screenshot_file(path: str, flags: int) -> int:
+    """
+    Open a file for `open()`, creating it with `SCREENSHOT_FILE_MODE`.
 
-    return copied_screenshots
+    Args:
+        path: The file to open.
+        flags: The flags chosen by `open()`.
+
+    Returns:
+        The file descriptor.
+    """
+    return os.open(path, flags, SCREENSHOT_FILE_MODE)
 
 
-def rename_screenshot(idx: int, screenshot_path: Path) -> str:
+def copy_file_range(
+    source_descriptor: int, destination_descriptor: int, source_stat: os.stat_result
+) -> bool:
+    """
+    Copy a file in the kernel, which can use reflinks or server-side copies.
+
+    Args:
+        source_descriptor: The file descriptor to copy from.
+        destination_descriptor: The file descriptor to copy to.
+        source_stat: The stat result of the source file.
+
+    Returns:
+        True if the file was copied, False if `os.copy_file_range` is unavailable, unsupported
+        for these files, or copied nothing from a non-empty file, in which case nothing was
+        copied.
+    """
+    if not hasattr(os, "copy_file_range"):
+        return False
+
+    count = max(source_stat.st_size, COPY_BUFFER_SIZE)
+    try:
+        copied = os.copy_file_range(source_descriptor, destination_descriptor, count)
+    except OSError as error:
+        # E.g., a copy across filesystems, or a filesystem that does not support it.
+        if error.errno in COPY_FILE_RANGE_UNSUPPORTED_ERRNOS:
+            return False
+        raise
+
+    # Some filesystems (e.g., 9P, or procfs-like ones) report 0 without copying anything. Nothing
+    # has moved yet, so both offsets are still at 0 and the buffered copy can take over.
+    if copied == 0 and source_stat.st_size > 0:
+        return False
+
+    # After the first chunk, 0 means the end of the file.
+    while copied:
+        copied = os.copy_file_range(source_descriptor, destination_descriptor, count)
+
+    return True
+
+
+def rename_screenshot(idx: int, screenshot_path: Path, timestamp: Optional[str] = None) -> str:
     """
     Rename the screenshot to the current date and time.
 
+    Args:
+    - idx: The index of the screenshot in its batch.
+    - screenshot_path: The path of the screenshot.
+    - timestamp: The ISO 8601 date and time to use, defaults to now.
+
     Returns:
     - The new screenshot name.
     """
@@ -225,26 +487,103 @@ def rename_screenshot(idx: int, screenshot_path: Path) -> str:
     if is_gif:
         return f"{prefix}{original_name}.{file_extension}"
     else:
+        if timestamp is None:
+            timestamp = datetime.datetime.now().isoformat(timespec="seconds")
+
         # Rename screenshot with ISO 8601 date and time, and append the index.
-        return f"{prefix}screenshot_{datetime.datetime.now().isoformat(timespec='seconds')}_{idx}.{file_extension}"
+        return f"{prefix}screenshot_{timestamp}_{idx}.{file_extension}"
 
 
 def stage_screenshots(screenshots: Tuple[Path]) -> None:
     """
     Automatically stage the screenshot(s) if the destination is a Git repo.
 
+    Git runs from the root of the repository, since the paths are relative to it.
+
     Args:
 
-    - screenshots: The screenshot(s).
+    - screenshots: The screenshot(s), relative to the root of the Git repository.
     """
-    # Automatically stage the screenshot(s) if the destination is a Git repo.
-    for screenshot in screenshots:
+    import subprocess
+
+    # Stage every screenshot with a single `git add`.
+    remaining = list(screenshots)
+    result = git_add_batch(remaining)
+
+    if result.returncode != 0:
+        # Git names the offending paths in its error message: report those, and retry the rest
+        # in a single batch.
+        failed = [
+            screenshot
+            for screenshot in remaining
+            if git_error_names_path(result.stderr, screenshot)
+        ]
+
+        if failed:
+            click.echo(result.stderr, err=True, nl=False)
+            for screenshot in failed:
+                click.echo(f"Failed to stage screenshot '{screenshot}'.")
+
+            remaining = [screenshot for screenshot in remaining if screenshot not in failed]
+            result = git_add_batch(remaining) if remaining else result
+
+    if result.returncode == 0 or not remaining:
+        return
+
+    # Git < 2.25 lacks `--pathspec-from-file`, and the failure may not name a path:
+    # fall back to one `git add` per screenshot to stage the others and report the failures.
+    for screenshot in remaining:
         try:
-            subprocess.run(["git", "add", str(screenshot)], check=True)
+            subprocess.run(
+                [get_git_executable(), "add", str(screenshot)], cwd=get_git_root(), check=True
+            )
         except subprocess.CalledProcessError:
             click.echo(f"Failed to stage screenshot '{screenshot}'.")
 
 
+def git_error_names_path(stderr: bytes, path: Path) -> bool:
+    """
+    Check whether a `git add` error message names a path.
+
+    Git echoes pathspecs as given: quoted in errors (e.g., "pathspec 'img/a.png' did not match
+    any files"), or alone on a line when listing ignored files. Matching the whole quoted path
+    or line, rather than a substring, keeps "a.png" from matching "animated_a.png".
+
+    Args:
+        stderr: The error output of `git add`.
+        path: The path, as passed to `git add`.
+
+    Returns:
+        True if the error message names the path.
+    """
+    encoded_path = os.fsencode(path)
+    return b"'" + encoded_path + b"'" in stderr or encoded_path in stderr.splitlines()
+
+
+def git_add_batch(paths: List[Path]) -> "subprocess.CompletedProcess[bytes]":
+    """
+    Stage files with a single `git add`.
+
+    The paths are passed NUL-separated on stdin, so that the argument list can't grow past
+    ARG_MAX.
+
+    Args:
+        paths: The files to stage, relative to the root of the Git repository.
+
+    Returns:
+        The completed process, with git's error output captured.
+    """
+    import subprocess
+
+    return subprocess.run(
+        [get_git_executable(), "add", "--pathspec-from-file=-", "--pathspec-file-nul"],
+        input=b"\0".join(os.fsencode(path) for path in paths),
+        cwd=get_git_root(),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+
+
 def format_screenshots_path_for_git(screenshots: Tuple[Path]) -> Tuple[Path, ...]:
     """
     Format the screenshot(s)'s path for git.
@@ -253,13 +592,13 @@ def format_screenshots_path_for_git(screenshots: Tuple[Path]) -> Tuple[Path, ...
 
     - screenshots: The screenshot(s).
     """
-    img_dir = get_git_repo_img_destination().parent.parent
-    formatted_screenshots: Tuple[Path, ...] = ()
+    git_root = get_git_root()
+    formatted_screenshots: List[Path] = []
 
     for screenshot in screenshots:
-        formatted_screenshots += (Path(screenshot).relative_to(img_dir),)
+        formatted_screenshots.append(Path(screenshot).relative_to(git_root))
 
-    return formatted_screenshots
+    return tuple(formatted_screenshots)
 
 
 def print_formatted_path(output_format: str, screenshots: Tuple[Path]) -> None:
@@ -271,26 +610,26 @@ def print_formatted_path(output_format: str, screenshots: Tuple[Path]) -> None:
     - output_format: The output format.
     - screenshots: The screenshot(s).
     """
+    template = OUTPUT_FORMAT_TEMPLATES.get(output_format)
+    if template is None:
+        click.echo(f"Invalid output format: {output_format}", err=True)
+        sys.exit(1)
+
+    # Adding a '/' to the screenshot path if the destination is a Git repo.
+    # This is because the screenshot path is relative to the git repo's.
+    relative_to_repo = is_git_repo()
+    lines = []
+
     for screenshot in screenshots:
-        # Adding a '/' to the screenshot path if the destination is a Git repo.
-        # This is because the screenshot path is relative to the git repo's.
-        if is_git_repo():
+        if relative_to_repo:
             screenshot_path = f"/{screenshot}"
         else:
             screenshot_path = str(screenshot)  # This is an absolute path.
 
-        if output_format == "markdown":
-            click.echo(f"![{screenshot.name}]({screenshot_path})")
+        lines.append(template.format(name=screenshot.name, path=screenshot_path))
 
-        elif output_format == "html":
-            click.echo(f'<img src="{screenshot_path}" alt="{screenshot.name}">')
-
-        elif output_format == "plain_text":
-            click.echo(screenshot_path)
-
-        else:
-            click.echo(f"Invalid output format: {output_format}", err=True)
-            sys.exit(1)
+    # A single write, rather than one per screenshot.
+    click.echo("\n".join(lines))
 
 
 def get_config_file_path() -> Path:
@@ -319,18 +658,150 @@ def read_config(config_file_path: Path) -> Dict[str, Any]:
     Returns:
         The configuration file as a dictionary.
     """
+    file_stat = config_file_path.stat()
+
+    # Fail early with a clear message rather than with an opaque error from the parser.
+    if not stat.S_ISREG(file_stat.st_mode):
+        click.echo(
+            click.style(f"Configuration file is not a regular file: {config_file_path}", fg="red"),
+            err=True,
+        )
+        sys.exit(1)
+
+    if file_stat.st_size > MAX_CONFIG_FILE_SIZE:
+        click.echo(
+            click.style(
+                f"Configuration file is too large ({file_stat.st_size} bytes): {config_file_path}",
+                fg="red",
+            ),
+            err=True,
+        )
+        sys.exit(1)
+
+    cached = _CONFIG_CACHE.get(config_file_path)
+    if cached is not None and cached[:2] == (file_stat.st_mtime_ns, file_stat.st_size):
+        return dict(cached[2])
+
     try:
-        with open(config_file_path, "r", encoding="UTF-8") as file:
-            config = json.load(file)
+        config = load_config_file(config_file_path)
 
     except json.JSONDecodeError:
         write_config(config_file_path)
-        with open(config_file_path, "r", encoding="UTF-8") as file:
-            config = json.load(file)
+        config = load_config_file(config_file_path)
+
+    return dict(config)
+
+
+def load_config_file(config_file_path: Path) -> Dict[str, Any]:
+    """
+    Parse the configuration file and cache it along with its mtime and size.
+
+    Args:
+        config_file_path: The path to the configuration file.
+
+    Returns:
+        The configuration file as a dictionary.
+    """
+    with open(config_file_path, "rb") as file:
+        file_stat = os.fstat(file.fileno())
+        content = file.read()
+
+    # A binary file would otherwise fail with an opaque UnicodeDecodeError from the json module.
+    if b"\x00" in content:
+        click.echo(
+            click.style(f"Configuration file is not a text file: {config_file_path}", fg="red"),
+            err=True,
+        )
+        sys.exit(1)
+
+    config = json_loads(content)
 
+    _CONFIG_CACHE[config_file_path] = (file_stat.st_mtime_ns, file_stat.st_size, config)
     return config
 
 
+def write_config_file(config_file_path: Path, config: Dict[str, Any], durable: bool = True) -> None:
+    """
+    Write the configuration to disk and refresh the cached copy.
+
+    Args:
+        config_file_path: The path to the configuration file.
+        config: The configuration to write.
+        durable: Whether to flush the write to disk before returning.
+    """
+    file_stat = atomic_write_json(config_file_path, config, durable=durable)
+    _CONFIG_CACHE[config_file_path] = (file_stat.st_mtime_ns, file_stat.st_size, dict(config))
+
+
+def atomic_write_json(path: Path, data: Any, durable: bool = True) -> os.stat_result:
+    """
+    Atomically replace a file with the JSON serialization of some data.
+
+    The data is written to a temporary file in the same directory, which is then renamed over
+    the target: readers see either the old or the new content, never a torn write. Symlinks are
+    followed, and the permission bits of an existing file are kept.
+
+    Args:
+        path: The file to write.
+        data: The data to serialize.
+        durable: Whether to fsync the file and its directory, so that the new content survives
+            a crash. Without it, the write is still atomic but may be lost on power failure.
+
+    Returns:
+        The stat result of the written file.
+    """
+    import tempfile
+
+    # Replace the real file rather than a symlink to it (e.g., a config tracked in a dotfiles
+    # repository), and keep its permission bits: mkstemp creates the temporary file as 0o600.
+    path = Path(os.path.realpath(path))
+    try:
+        mode: Optional[int] = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    file_descriptor, temp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        if mode is not None:
+            os.fchmod(file_descriptor, mode)
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(json_dumps(data))
+            file.flush()
+            if durable:
+                fdatasync(file.fileno())
+            file_stat = os.fstat(file.fileno())
+
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+    if durable:
+        fsync_directory(path.parent)
+
+    return file_stat
+
+
+def fsync_directory(directory: Path) -> None:
+    """
+    Flush the entries of a directory (e.g., a rename) to disk.
+
+    Args:
+        directory: The directory to flush.
+    """
+    directory_descriptor = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(directory_descriptor)
+    except OSError as error:
+        # Some filesystems (e.g., SMB mounts) do not support fsync on directories.
+        if error.errno not in (errno.ENOTSUP, errno.EINVAL):
+            raise
+    finally:
+        os.close(directory_descriptor)
+
+
 def write_config(config_file_path: Path) -> None:
     """
     Write the configuration file.
@@ -341,64 +812,28 @@ def write_config(config_file_path: Path) -> None:
 
     # Read the current configuration file if it exists.
     try:
-        with open(config_file_path, "r", encoding="UTF-8") as file:
-            current_config = json.load(file)
+        with open(config_file_path, "rb") as file:
+            current_config = json_loads(file.read())
     except (FileNotFoundError, json.JSONDecodeError):
         current_config = {}
 
-    if current_config:
-        click.echo(f"{click.style('Updating the configuration file...', fg='yellow')}")
-    else:
-        click.echo(f"{click.style('Creating the configuration file...', fg='yellow')}")
-    click.echo()
-
-    # Configuration fields
-    config_fields = {
-        "default_source": ("Enter the path for the default source directory", ""),
-        "default_destination": (
-            "Enter the path for the default destination directory",
-            "",
-        ),
-        "auto_stage_enabled": (
-            "Automatically stage screenshots when copying to a git repository?",
-            False,
-        ),
-        "default_output_format": (
-            "Enter the default output format (markdown, html, plain_text)",
-            "markdown",
-        ),
-    }
+    # The header and the blank line after it, in a single write.
+    click.echo(f"{CONFIG_UPDATING_HEADER if current_config else CONFIG_CREATING_HEADER}\n")
 
     # Prompt the user for configuration values.
     config = {}
-    for field, (message, default) in config_fields.items():
-        if field in ["default_source", "default_destination"]:
-            config[field] = get_validated_directory_input(field, message, current_config, default)
-        elif field == "auto_stage_enabled":
-            config[field] = get_config_boolean_input(field, message, current_config, default)
-        elif field == "default_output_format":
-            config[field] = get_validated_input(
-                field,
-                message,
-                current_config,
-                default,
-                options=["markdown", "html", "plain_text"],
-            )
-        else:
-            config[field] = get_config_input(field, message, current_config, default)
+    for field, prompt, message, default in CONFIG_PROMPTS:
+        config[field] = prompt(field, message, current_config, default)
 
     # Writing configuration to file
     try:
-        with open(config_file_path, "w", encoding="UTF-8") as file:
-            json.dump(config, file, indent=4)
+        # Interactive saves favor latency: the write is atomic, just not fsync'ed.
+        write_config_file(config_file_path, config, durable=False)
     except FileNotFoundError as error:
         click.echo(f"Failed to write configuration file: {error}", err=True)
         sys.exit(1)
 
-    if current_config:
-        click.echo(f"{click.style('Configuration file updated', fg='green')}")
-    else:
-        click.echo(f"{click.style('Configuration file created', fg='green')}")
+    click.echo(CONFIG_UPDATED_TRAILER if current_config else CONFIG_CREATED_TRAILER)
 
 
 def get_config_input(field, message, current_config, default="") -> str:
@@ -421,46 +856,74 @@ def get_config_boolean_input(field, message, current_config, default=False) -> b
 
 def get_validated_directory_input(field, message, current_config, default) -> str:
     while True:
-        directory = get_config_input(field, message, current_config, default)
+        directory = get_config_input(field, message, current_config, default).strip()
 
         # If no value is provided, use the default (that is, an empty string).
-        if not directory.strip():
+        if not directory:
             return default
 
         try:
             return str(Path(directory).resolve(strict=True))
         except FileNotFoundError as error:
-            click.echo(
-                click.style(f"Invalid {field.replace('_', ' ')}: {error}", fg="red"),
-                err=True,
-            )
-        finally:
+            echo_path_error(field.replace("_", " "), error)
             click.echo()
 
 
 def get_validated_input(field, message, current_config, default="", options=None) -> str:
     existing = current_config.get(field, default)
+    styled_message = click.style(message, fg="blue")
 
     while True:
         value = click.prompt(
-            click.style(message, fg="blue"),
+            styled_message,
             type=str,
             default=existing,
             show_default=True,
         )
 
-        if options and value.lower() not in options:
-            click.echo(
-                click.style(
-                    f"Invalid option for {field.replace('_', ' ')}. Please choose from {', '.join(options)}.",
-                    fg="red",
+        if options:
+            value = value.lower()
+            if value not in options:
+                click.echo(
+                    click.style(
+                        f"Invalid option for {field.replace('_', ' ')}. Please choose from {', '.join(options)}.",
+                        fg="red",
+                    )
                 )
-            )
-            continue
+                continue
 
         return value
 
 
+# The interactive prompt of each configuration field: (field, prompt function, message, default).
+CONFIG_PROMPTS = (
+    (
+        "default_source",
+        get_validated_directory_input,
+        "Enter the path for the default source directory",
+        "",
+    ),
+    (
+        "default_destination",
+        get_validated_directory_input,
+        "Enter the path for the default destination directory",
+        "",
+    ),
+    (
+        "auto_stage_enabled",
+        get_config_boolean_input,
+        "Automatically stage screenshots when copying to a git repository?",
+        False,
+    ),
+    (
+        "default_output_format",
+        functools.partial(get_validated_input, options=VALID_OUTPUT_FORMATS),
+        f"Enter the default output format ({', '.join(VALID_OUTPUT_FORMATS)})",
+        "markdown",
+    ),
+)
+
+
 def set_default_source(source_str: str) -> None:
     """
     Set the default source directory.
@@ -468,18 +931,7 @@ def set_default_source(source_str: str) -> None:
     Args:
         source: The default source directory.
     """
-    try:
-        source: Path = str(Path(source_str).resolve(strict=True))
-    except FileNotFoundError as error:
-        click.echo(click.style(f"Invalid source directory: {error}", fg="red"), err=True)
-        sys.exit(1)
-
-    config_file_path = get_config_file_path()
-    config = read_config(config_file_path)
-    config["default_source"] = source
-
-    with open(config_file_path, "w", encoding="UTF-8") as file:
-        json.dump(config, file, indent=4)
+    update_config_field("default_source", source_str)
 
 
 def set_default_destination(destination_str: str) -> None:
@@ -489,18 +941,64 @@ def set_default_destination(destination_str: str) -> None:
     Args:
         destination: The default destination directory.
     """
+    update_config_field("default_destination", destination_str)
+
+
+def normalize_directory(name: str, directory_str: str) -> str:
+    """
+    Resolve a directory for the configuration file, exiting if it does not exist.
+
+    An empty string is kept as is, which resets the directory to its default.
+
+    Args:
+        name: The name of the directory, used in the error message (e.g., "source").
+        directory_str: The directory to resolve.
+
+    Returns:
+        The resolved directory, or an empty string.
+    """
+    if not directory_str:
+        return ""
+
     try:
-        destination: Path = str(Path(destination_str).resolve(strict=True))
+        return str(Path(directory_str).resolve(strict=True))
     except FileNotFoundError as error:
-        click.echo(click.style(f"Invalid destination directory: {error}", fg="red"), err=True)
+        echo_path_error(f"{name} directory", error)
         sys.exit(1)
 
+
+def echo_path_error(name: str, error: OSError) -> None:
+    """
+    Report an invalid directory on stderr.
+
+    Args:
+        name: The name of the directory (e.g., "source directory").
+        error: The error raised while resolving the directory.
+    """
+    click.echo(click.style(f"Invalid {name}: {error}", fg="red"), err=True)
+
+
+def write_config_fields(fields: Dict[str, Any]) -> None:
+    """
+    Validate, normalize, and write several configuration fields.
+
+    Every field is normalized before the configuration file is touched, so an invalid value
+    leaves the file unchanged; the file is then read and written once for all the fields.
+
+    Args:
+        fields: The configuration fields to update, mapped to their new values.
+    """
+    resolved = [(field, CONFIG_FIELD_NORMALIZERS[field], value) for field, value in fields.items()]
+    updates = {field: normalize(value) for field, normalize, value in resolved}
+
     config_file_path = get_config_file_path()
     config = read_config(config_file_path)
-    config["default_destination"] = destination
 
-    with open(config_file_path, "w", encoding="UTF-8") as file:
-        json.dump(config, file, indent=4)
+    # Re-applying the current values is a no-op: skip rewriting the file.
+    if all(field in config and config[field] == value for field, value in updates.items()):
+        return
+
+    write_config_file(config_file_path, {**config, **updates})
 
 
 def get_destination() -> Path:
@@ -510,8 +1008,9 @@ def get_destination() -> Path:
     Returns:
         The destination directory.
     """
-    if is_git_repo():
-        return get_git_repo_img_destination()
+    git_root = get_git_root()
+    if git_root is not None:
+        return get_git_repo_img_destination(git_root)
 
     config = read_config(get_config_file_path())
     if config["default_destination"]:
@@ -527,52 +1026,107 @@ def is_git_repo() -> bool:
     Returns:
         True if the current directory is a Git repository, False otherwise.
     """
+    return get_git_root() is not None
+
+
+def get_git_root() -> Optional[Path]:
+    """
+    Get the root directory of the current Git repository.
+
+    Returns:
+        The root directory of the Git repository, or None if the current directory is not
+        inside a Git work tree.
+    """
+    return find_git_root(os.getcwd())
+
+
+@functools.lru_cache(maxsize=None)
+def get_git_executable() -> str:
+    """
+    Locate the git executable on the PATH once, so that each git call skips the PATH search.
+
+    Returns:
+        The path to the git executable, or "git" if it is not on the PATH.
+    """
+    import shutil
+
+    return shutil.which("git") or "git"
+
+
+@functools.lru_cache(maxsize=None)
+def find_git_root(directory: str) -> Optional[Path]:
+    """
+    Find the root directory of the Git repository containing a directory.
+
+    A single `git rev-parse --show-toplevel` both detects the repository and locates its root.
+    The result is cached, so each directory costs at most one git process per invocation.
+
+    Args:
+        directory: The directory to look up.
+
+    Returns:
+        The root directory of the Git repository, or None if the directory is not inside a
+        Git work tree.
+    """
+    import subprocess
+
     try:
-        subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
-            stdout=subprocess.DEVNULL,
+        result = subprocess.run(
+            [get_git_executable(), "rev-parse", "--show-toplevel"],
+            cwd=directory,
+            stdout=subprocess.PIPE,
             stderr=subprocess.DEVNULL,
-            check=True,
         )
-    except subprocess.CalledProcessError:
-        return False
+    except FileNotFoundError:  # Git is not installed.
+        return None
 
-    return True
+    if result.returncode != 0:
+        return None
+
+    return Path(result.stdout.strip().decode("utf-8"))
 
 
-def get_git_repo_img_destination() -> Path:
+def get_git_repo_img_destination(git_root: Optional[Path] = None) -> Path:
     """
     Get the destination directory for a Git repository.
 
+    Args:
+        git_root: The root directory of the Git repository. Looked up if not provided.
+
     Returns:
         The destination directory for a Git repository.
     """
+    if git_root is None:
+        git_root = get_git_root()
+        if git_root is None:
+            sys.exit("Failed to get git root directory.")
+
+    # One directory read of the repository root replaces a stat per candidate.
+    # Only real directories qualify: a symlink could point outside the repository.
     try:
-        git_root_str = (
-            subprocess.run(
-                ["git", "rev-parse", "--show-toplevel"],
-                check=True,
-                stdout=subprocess.PIPE,
-            )
-            .stdout.strip()
-            .decode("utf-8")
-        )
-    except subprocess.CalledProcessError:
-        sys.exit("Failed to get git root directory.")
-
-    git_root: Path = Path(git_root_str)
-
-    if (git_root / "img").exists():
-        destination = git_root / "img"
-    elif (git_root / "images").exists():
-        destination = git_root / "images"
-    elif (git_root / "assets" / "img").exists():
-        destination = git_root / "assets" / "img"
-    elif (git_root / "assets" / "images").exists():
-        destination = git_root / "assets" / "images"
-    else:
-        destination = git_root / "assets" / "images"
-        destination.mkdir(parents=True, exist_ok=True)
+        with os.scandir(git_root) as entries:
+            root_directories = {
+                entry.name for entry in entries if entry.is_dir(follow_symlinks=False)
+            }
+    except OSError:
+        root_directories = set()
+
+    for top_level_name, relative_path in GIT_IMAGE_DIRECTORY_CANDIDATES:
+        if top_level_name not in root_directories:
+            continue
+
+        candidate = git_root / relative_path
+        if relative_path == top_level_name:
+            return candidate
+
+        try:
+            if stat.S_ISDIR(os.lstat(candidate).st_mode):
+                return candidate
+        except OSError:
+            continue
+
+    destination = git_root / GIT_IMAGE_DIRECTORY_CANDIDATES[-1][1]
+    destination.mkdir(parents=True, exist_ok=True)
 
     return destination
 
@@ -584,12 +1138,7 @@ def set_auto_stage(auto_stage_enabled: bool) -> None:
     Args:
         auto_stage_enabled: Whether screenshots are automatically staged when copied to a Git repo.
     """
-    config_file_path = get_config_file_path()
-    config = read_config(config_file_path)
-    config["auto_stage_enabled"] = auto_stage_enabled
-
-    with open(config_file_path, "w", encoding="UTF-8") as file:
-        json.dump(config, file, indent=4)
+    update_config_field("auto_stage_enabled", auto_stage_enabled)
 
 
 def set_default_output_format(output_format: str) -> None:
@@ -599,17 +1148,50 @@ def set_default_output_format(output_format: str) -> None:
     Args:
         output_format: The default output format.
     """
-    if output_format.casefold() not in ["markdown", "html", "plain_text"]:
+    update_config_field("default_output_format", output_format)
+
+
+def normalize_output_format(output_format: str) -> str:
+    """
+    Normalize an output format, exiting if it is invalid.
+
+    Args:
+        output_format: The output format.
+
+    Returns:
+        The normalized output format.
+    """
+    # Valid formats are ASCII, for which lower() matches casefold() and is cheaper.
+    if output_format.isascii():
+        normalized_output_format = output_format.lower()
+    else:
+        normalized_output_format = output_format.casefold()
+    if normalized_output_format not in VALID_OUTPUT_FORMAT_SET:
         click.echo(click.style(f"Invalid output format: {output_format}", fg="red"), err=True)
-        click.echo("Valid options are: markdown, html, plain_text", err=True)
+        click.echo(f"Valid options are: {', '.join(VALID_OUTPUT_FORMATS)}", err=True)
         sys.exit(1)
 
-    config_file_path = get_config_file_path()
-    config = read_config(config_file_path)
-    config["default_output_format"] = output_format.casefold()
+    return normalized_output_format
+
+
+# Validation and normalization of each field written by the `configure` options.
+CONFIG_FIELD_NORMALIZERS: Dict[str, Callable[[Any], Any]] = {
+    "default_source": functools.partial(normalize_directory, "source"),
+    "default_destination": functools.partial(normalize_directory, "destination"),
+    "auto_stage_enabled": bool,
+    "default_output_format": normalize_output_format,
+}
+
 
-    with open(config_file_path, "w", encoding="UTF-8") as file:
-        json.dump(config, file, indent=4)
+def update_config_field(field: str, value: Any) -> None:
+    """
+    Validate, normalize, and write a single configuration field.
+
+    Args:
+        field: The configuration field.
+        value: The new value of the field.
+    """
+    write_config_fields({field: value})
 
 
 @wslshot.command()
@@ -651,19 +1233,18 @@ def configure(source, destination, auto_stage_enabled, output_format):
 
     - For VM users, you should configure a shared folder between Windows and the VM before proceeding.
     """
+    options = {
+        "default_source": source,
+        "default_destination": destination,
+        "auto_stage_enabled": auto_stage_enabled,
+        "default_output_format": output_format,
+    }
+    provided = {field: value for field, value in options.items() if value is not None}
+
     # When no options are specified, ask the user for their preferences.
-    if not any((source, destination, auto_stage_enabled, output_format)):
+    if not provided:
         write_config(get_config_file_path())
+        return
 
-    # Otherwise, set the specified options.
-    if source:
-        set_default_source(source)
-
-    if destination:
-        set_default_destination(destination)
-
-    if auto_stage_enabled is not None:
-        set_auto_stage(auto_stage_enabled)
-
-    if output_format:
-        set_default_output_format(output_format)
+    # Otherwise, validate the specified options and write them all at once.
+    write_config_fields(provided)